@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import generateVectorData
+import generateVectorData2
+import generateVectorData3
+
+# Generators run by generate_all, each called with its own DEFAULT_PARAMS
+_GENERATORS = [generateVectorData, generateVectorData2, generateVectorData3]
+
+def generate_all(seed=None):
+    """
+    Generates the data and query files of every vector dataset concurrently.
+
+    Each generator is independent and CPU-bound, so each one runs in its own
+    worker process with the parameters it uses when run directly.
+
+    Args:
+        seed (int): Optional root seed. When given, an independent seed is
+                    derived from it for each generator; when None, each
+                    generator uses its own default seed, so the files match
+                    those written by running the scripts directly. Default is None.
+
+    Writes:
+        ./tests/_Data/_data.csv, ./tests/_Data/_queries.csv: See generateVectorData.py.
+        ./tests/_Data/_data2.csv, ./tests/_Data/_queries2.csv: See generateVectorData2.py.
+        ./tests/_Data/_data3.csv, ./tests/_Data/_queries3.csv: See generateVectorData3.py.
+    """
+    params = [dict(module.DEFAULT_PARAMS) for module in _GENERATORS]
+
+    # Derive one child seed per generator so the datasets stay independent
+    if seed is not None:
+        for p, child in zip(params, np.random.SeedSequence(seed).spawn(len(_GENERATORS))):
+            p["seed"] = int(child.generate_state(1)[0])
+
+    with ProcessPoolExecutor(max_workers=len(_GENERATORS)) as ex:
+        futures = [ex.submit(module.generate_data, **p)
+                   for module, p in zip(_GENERATORS, params)]
+
+        # Propagate any exception raised in a worker
+        for future in futures:
+            future.result()
+
+if __name__ == "__main__":
+    # Generate all vector datasets with the default parameters of each script
+    generate_all()
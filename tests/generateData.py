@@ -1,7 +1,8 @@
-import random
-import string
+import numpy as np
 
-def generate_key_value_pairs(num_pairs, key_length=10, value_range=(1, 100000)):
+from generateUtils import ALPHABET, WRITE_BUFFER_SIZE
+
+def generate_key_value_pairs(num_pairs, key_length=10, value_range=(1, 100000), seed=0):
     """
     Generates a dictionary of random key-value pairs.
 
@@ -9,22 +10,27 @@ def generate_key_value_pairs(num_pairs, key_length=10, value_range=(1, 100000)):
         num_pairs (int): The number of key-value pairs to generate.
         key_length (int): The length of each randomly generated key. Default is 10.
         value_range (tuple): A tuple specifying the range (inclusive) of the random values. Default is (1, 100000).
+        seed (int): Seed for the random generator. Default is 0.
 
     Returns:
         dict: A dictionary where each key is a random alphanumeric string and each value is a random integer within the specified range.
     """
-    key_value_pairs = {}
+    rng = np.random.default_rng(seed)
 
-    # Generate the specified number of key-value pairs
-    for _ in range(num_pairs):
-        # Generate a random key of the specified length using letters and digits
-        key = ''.join(random.choices(string.ascii_letters + string.digits, k=key_length))
+    # Draw every key character at once and view each row as a fixed-width string
+    # (a zero-width string dtype does not exist, so empty keys are built directly)
+    if key_length > 0:
+        idx = rng.integers(0, len(ALPHABET), size=(num_pairs, key_length), dtype=np.uint8)
+        keys = ALPHABET[idx].view(f"S{key_length}").ravel().astype(str).tolist()
+    else:
+        keys = [""] * num_pairs
 
-        # Generate a random value within the specified range
-        value = random.randint(*value_range)
+    # Draw every value within the specified range (inclusive) at once
+    vlo, vhi = value_range
+    values = rng.integers(vlo, vhi + 1, size=num_pairs)
 
-        # Add the key-value pair to the dictionary
-        key_value_pairs[key] = value
+    # Pair keys with values; later duplicates of a key overwrite earlier ones
+    key_value_pairs = dict(zip(keys, values.tolist()))
 
     return key_value_pairs
 
@@ -36,10 +42,10 @@ if __name__ == "__main__":
     key_value_pairs = generate_key_value_pairs(num_pairs)
 
     # Save the key-value pairs to a file
-    with open("key_value_pairs.txt", "w") as f:
-        for key, value in key_value_pairs.items():
-            # Write each key-value pair in the format: key value
-            f.write(f"{key} {value}\n")
+    with open("key_value_pairs.txt", "w", buffering=WRITE_BUFFER_SIZE, newline="\n") as f:
+        # Write every key-value pair in the format: key value, in a single call
+        if key_value_pairs:
+            f.write("\n".join(f"{key} {value}" for key, value in key_value_pairs.items()) + "\n")
 
     # Print a message indicating successful generation and saving
     print(f"Generated {num_pairs} key-value pairs and saved to 'key_value_pairs.txt'.")
@@ -1,7 +1,8 @@
-import random
-import string
+import numpy as np
 
-def generate_random(num_pairs, value_length=10, key_range=(1, 1000000)):
+from generateUtils import ALPHABET, WRITE_BUFFER_SIZE
+
+def generate_random(num_pairs, value_length=10, key_range=(1, 1000000), seed=0):
     """
     Generates a list of random key-value pairs.
 
@@ -9,22 +10,28 @@ def generate_random(num_pairs, value_length=10, key_range=(1, 1000000)):
         num_pairs (int): The number of key-value pairs to generate.
         value_length (int): The length of each randomly generated value. Default is 10.
         key_range (tuple): A tuple specifying the range (inclusive) of the random keys. Default is (1, 1000000).
+        seed (int): Seed for the random generator. Default is 0.
 
     Returns:
         list: A list of tuples, where each tuple contains a random integer key and a random alphanumeric string value.
     """
-    key_value_pairs = []
+    rng = np.random.default_rng(seed)
 
-    # Generate the specified number of key-value pairs
-    for _ in range(num_pairs):
-        # Generate a random key within the specified range
-        key = random.randint(*key_range)
+    # Draw every random key within the specified range (inclusive) at once
+    key_lo, key_hi = key_range
+    keys = rng.integers(key_lo, key_hi + 1, size=num_pairs)
 
-        # Generate a random value of the specified length using letters and digits
-        value = ''.join(random.choices(string.ascii_letters + string.digits, k=value_length))
+    # Draw every value character in one call, map it through the alphabet and
+    # view each row as a fixed-width string (a zero-width string dtype does not
+    # exist, so empty values are built directly)
+    if value_length > 0:
+        idx = rng.integers(0, len(ALPHABET), size=(num_pairs, value_length), dtype=np.uint8)
+        values = ALPHABET[idx].view(f"S{value_length}").ravel().astype(str).tolist()
+    else:
+        values = [""] * num_pairs
 
-        # Append the key-value pair as a tuple to the list
-        key_value_pairs.append((key, value))
+    # Pair each key with its value as a tuple
+    key_value_pairs = list(zip(keys.tolist(), values))
 
     return key_value_pairs
 
@@ -36,10 +43,10 @@ if __name__ == "__main__":
     key_value_pairs = generate_random(num_pairs)
 
     # Save the key-value pairs to a file
-    with open("key_value_pairs_2.txt", "w") as f:
-        for key, value in key_value_pairs:
-            # Write each key-value pair in the format: key value
-            f.write(f"{key} {value}\n")
+    with open("key_value_pairs_2.txt", "w", buffering=WRITE_BUFFER_SIZE, newline="\n") as f:
+        # Write every key-value pair in the format: key value, in a single call
+        if key_value_pairs:
+            f.write("\n".join(f"{key} {value}" for key, value in key_value_pairs) + "\n")
 
     # Print a message indicating successful generation and saving
     print(f"Generated {num_pairs} key-value pairs and saved to 'key_value_pairs_2.txt'.")
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import string
+
+import numpy as np
+
+# Write buffer size for the generated files (1 MiB), so large outputs flush rarely
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Lookup table of the characters allowed in random alphanumeric strings
+ALPHABET = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype=np.uint8)
+
+def format_csv(arr, fmts):
+    """
+    Formats a 2-D array as ASCII CSV rows with a single %-formatting call.
+
+    Args:
+        arr (np.ndarray): Array of shape (rows, columns).
+        fmts (list): One printf-style format per column.
+
+    Returns:
+        bytes: The formatted rows, each terminated by a newline.
+    """
+    row_fmt = (",".join(fmts) + "\n").encode("ascii")
+    return (row_fmt * len(arr)) % tuple(arr.ravel().tolist())
+
+def cache_key(params):
+    """
+    Hashes the generation parameters into a short key identifying the output files.
+
+    Returns:
+        str: The first 12 hex digits of the SHA-1 of repr(params).
+    """
+    return hashlib.sha1(repr(params).encode()).hexdigest()[:12]
+
+def _file_stats(paths):
+    """
+    Returns the size and modification time (ns) of every path, keyed by path.
+    """
+    stats = {}
+    for path in paths:
+        # One stat call per path, so the size and mtime describe the same file state
+        st = os.stat(path)
+        stats[path] = [st.st_size, st.st_mtime_ns]
+    return stats
+
+def is_cached(paths, key):
+    """
+    Checks whether the output files are the ones last generated with the given key.
+
+    The key of the last generation, together with the size and modification
+    time of every output file, is stored next to the first path in a ".key"
+    file, so the output files themselves keep their fixed names. A file that
+    was rewritten since (e.g. by a git checkout) no longer matches.
+
+    Returns:
+        bool: True if every path exists, the stored key matches key and no
+        output file changed since it was generated.
+    """
+    stamp = paths[0] + ".key"
+    if not all(os.path.exists(path) for path in [*paths, stamp]):
+        return False
+    try:
+        with open(stamp) as f:
+            stored = json.load(f)
+    except ValueError:
+        return False
+    return stored == {"key": key, "files": _file_stats(paths)}
+
+def store_cache_key(paths, key):
+    """
+    Records key, and the current size and modification time of the freshly
+    generated output files, in the stamp file checked by is_cached.
+    """
+    with open(paths[0] + ".key", "w") as f:
+        json.dump({"key": key, "files": _file_stats(paths)}, f)
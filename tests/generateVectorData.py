@@ -1,9 +1,18 @@
-import random
 import sys
+import os
+
+import numpy as np
+
+from generateUtils import WRITE_BUFFER_SIZE, cache_key, format_csv, is_cached, store_cache_key
+
+# Version of the layout of the written files; bump it whenever the output
+# format changes so that previously generated files are not reused
+_FORMAT_VERSION = 1
 
 def generate_data(N=100, D=4, Q=10,
                   vec_range=(0.0, 10.0), s_range=(0.0, 100.0),
-                  query_s_range=(0.0, 100.0), k_range=(1, 10), O_value=1000):
+                  query_s_range=(0.0, 100.0), k_range=(1, 10), O_value=1000,
+                  seed=1):
     """
     Generates data and query files for testing.
 
@@ -16,49 +25,69 @@ def generate_data(N=100, D=4, Q=10,
         query_s_range (tuple): Range for scalar values in queries. Default is (0.0, 100.0).
         k_range (tuple): Range for k values in queries. Default is (1, 10).
         O_value (int): Fixed O value for queries. Default is 1000.
+        seed (int): Seed for the random generator. Default is 1; each vector
+                    generator uses its own default so the datasets are independent.
+
+    Generation is skipped when both files already exist, were generated with
+    the same parameters and output format, and have not changed since.
 
     Writes:
         ./tests/_Data/_data.csv: Generated data with vector and scalar values.
         ./tests/_Data/_queries.csv: Generated queries with vector, k, Smin, Smax, and O values.
     """
+    data_file = "./tests/_Data/_data.csv"
+    queries_file = "./tests/_Data/_queries.csv"
+
+    # Skip generation if the files already hold data for these parameters
+    key = cache_key((_FORMAT_VERSION, N, D, Q, vec_range, s_range, query_s_range, k_range, O_value, seed))
+    if is_cached([data_file, queries_file], key):
+        print(f"{data_file} and {queries_file} are up to date, skipping generation.")
+        return
+
+    rng = np.random.default_rng(seed)
+
+    # Ensure the output directory exists
+    os.makedirs("./tests/_Data/", exist_ok=True)
+
     # Write data to data.csv
-    with open("./tests/_Data/_data.csv", "w") as f_data:
+    with open(data_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_data:
         # Header for data
         data_header = [f"v{i+1}" for i in range(D)] + ["s"]
-        f_data.write(",".join(data_header) + "\n")
+        f_data.write((",".join(data_header) + "\n").encode("ascii"))
+
+        # Generate all random vectors and scalar values at once
+        vecs = rng.uniform(*vec_range, size=(N, D))
+        scalars = rng.uniform(*s_range, size=N)
 
-        for i in range(N):
-            # Generate a random vector and scalar value
-            vec = [random.uniform(*vec_range) for _ in range(D)]
-            s = random.uniform(*s_range)
-            line = ",".join(map(str, vec)) + "," + str(s) + "\n"
-            f_data.write(line)
+        f_data.write(format_csv(np.column_stack([vecs, scalars]), ["%.6f"] * (D + 1)))
 
     # Write queries to queries.csv
-    with open("./tests/_Data/_queries.csv", "w") as f_queries:
+    with open(queries_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_queries:
         # Header for queries
         query_header = [f"qv{i+1}" for i in range(D)] + ["k", "Smin", "Smax", "O"]
-        f_queries.write(",".join(query_header) + "\n")
+        f_queries.write((",".join(query_header) + "\n").encode("ascii"))
 
-        for i in range(Q):
-            # Generate a random query vector
-            qvec = [random.uniform(*vec_range) for _ in range(D)]
-            k = random.randint(*k_range)
+        # Generate all random query vectors and k values at once
+        qvecs = rng.uniform(*vec_range, size=(Q, D))
+        ks = rng.integers(k_range[0], k_range[1] + 1, size=Q)
 
-            # Generate Smin and Smax ensuring Smin <= Smax
-            Smin = random.uniform(query_s_range[0], query_s_range[1] / 2)
-            Smax = random.uniform(query_s_range[1] / 2, query_s_range[1])
-            if Smin > Smax:
-                Smin, Smax = Smax, Smin
+        # Generate Smin and Smax ensuring Smin <= Smax
+        Smin = rng.uniform(query_s_range[0], query_s_range[1] / 2, size=Q)
+        Smax = rng.uniform(query_s_range[1] / 2, query_s_range[1], size=Q)
+        Smin, Smax = np.minimum(Smin, Smax), np.maximum(Smin, Smax)
 
-            line = ",".join(map(str, qvec)) + f",{k},{Smin},{Smax},{O_value}\n"
-            f_queries.write(line)
+        queries = np.column_stack([qvecs, ks, Smin, Smax, np.full(Q, O_value)])
+        f_queries.write(format_csv(queries, ["%.6f"] * D + ["%d", "%.6f", "%.6f", "%d"]))
 
-if __name__ == "__main__":
-    # Default values
-    N = 10000
-    D = 4
-    Q = 10
+    store_cache_key([data_file, queries_file], key)
+
+# Parameters used when the script is run directly
+DEFAULT_PARAMS = dict(
+    N=10000,  # Number of data points
+    D=4,      # Dimension of vectors
+    Q=10,     # Number of queries
+)
 
+if __name__ == "__main__":
     # Generate data and queries
-    generate_data(N, D, Q)
+    generate_data(**DEFAULT_PARAMS)
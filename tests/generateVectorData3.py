@@ -1,13 +1,20 @@
-import random
 import math
 import os
-from scipy.stats import norm
+from statistics import NormalDist
+
+import numpy as np
+
+from generateUtils import WRITE_BUFFER_SIZE, cache_key, format_csv, is_cached, store_cache_key
+
+# Version of the layout of the written files; bump it whenever the output
+# format changes so that previously generated files are not reused
+_FORMAT_VERSION = 2
 
 def generate_data(N=10000, D=4,
                  vec_range=(0.0, 10.0),
                  s_mean=50.0, s_variance=25.0,
                  p=0.01,  # Desired proportion of items satisfying [Smin, Smax]
-                 k_range=(1, 10), O_value=1000):
+                 k_range=(1, 10), O_value=1000, seed=3):
     """
     Generates data and a single query for testing the VectorIndex.
 
@@ -20,6 +27,11 @@ def generate_data(N=10000, D=4,
         p (float): Desired proportion of items to satisfy the scalar condition [Smin, Smax]. Must be between 0 and 1. Default is 0.01.
         k_range (tuple): Range for k values in the query. Default is (1, 10).
         O_value (int): Fixed O value for the query. Default is 1000.
+        seed (int): Seed for the random generator. Default is 3; each vector
+                    generator uses its own default so the datasets are independent.
+
+    Generation is skipped when both files already exist, were generated with
+    the same parameters and output format, and have not changed since.
 
     Writes:
         ./tests/_Data/_data.csv: Generated data with vector and scalar values.
@@ -37,58 +49,67 @@ def generate_data(N=10000, D=4,
     data_file = os.path.join(output_dir, "_data3.csv")
     queries_file = os.path.join(output_dir, "_queries3.csv")
 
+    # Skip generation if the files already hold data for these parameters
+    key = cache_key((_FORMAT_VERSION, N, D, vec_range, s_mean, s_variance, p, k_range, O_value, seed))
+    if is_cached([data_file, queries_file], key):
+        print(f"{data_file} and {queries_file} are up to date, skipping generation.")
+        return
+
+    rng = np.random.default_rng(seed)
+
+    # Standard deviation of the scalar values
+    sigma = math.sqrt(s_variance)
+
     # Write data to _data.csv
-    with open(data_file, "w") as f_data:
+    with open(data_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_data:
         # Header for data
         data_header = [f"v{i+1}" for i in range(D)] + ["s"]
-        f_data.write(",".join(data_header) + "\n")
+        f_data.write((",".join(data_header) + "\n").encode("ascii"))
+
+        # Generate all random vectors, and scalar values from a normal distribution
+        vecs = rng.uniform(*vec_range, size=(N, D))
+        scalars = rng.normal(s_mean, sigma, size=N)
 
-        for _ in range(N):
-            # Generate a random vector
-            vec = [random.uniform(*vec_range) for _ in range(D)]
-            # Generate a scalar value from a normal distribution
-            s = random.gauss(s_mean, math.sqrt(s_variance))
-            # Write the data point
-            line = ",".join(map(str, vec)) + "," + f"{s:.5f}" + "\n"
-            f_data.write(line)
+        # Write the data points
+        f_data.write(format_csv(np.column_stack([vecs, scalars]), ["%.6f"] * D + ["%.5f"]))
 
     # Compute Smin and Smax based on desired proportion p
     # Using two-tailed interval around the mean
-    z = norm.ppf((1 + p) / 2)  # z-score for the two-tailed p
-    Smin = s_mean - z * math.sqrt(s_variance)
-    Smax = s_mean + z * math.sqrt(s_variance)
+    z = NormalDist().inv_cdf((1 + p) / 2)  # z-score for the two-tailed p
+    Smin = s_mean - z * sigma
+    Smax = s_mean + z * sigma
 
     # Write query to _queries.csv
-    with open(queries_file, "w") as f_queries:
+    with open(queries_file, "wb", buffering=WRITE_BUFFER_SIZE) as f_queries:
         # Header for queries
         query_header = [f"qv{i+1}" for i in range(D)] + ["k", "Smin", "Smax", "O"]
-        f_queries.write(",".join(query_header) + "\n")
+        f_queries.write((",".join(query_header) + "\n").encode("ascii"))
 
         # Generate a single query vector
-        qvec = [random.uniform(*vec_range) for _ in range(D)]
+        qvec = rng.uniform(*vec_range, size=D)
         # Randomly choose k from k_range
-        k = random.randint(*k_range)
+        k = rng.integers(k_range[0], k_range[1] + 1)
 
-        # Format Smin and Smax to 5 decimal places
-        Smin_formatted = f"{Smin:.5f}"
-        Smax_formatted = f"{Smax:.5f}"
+        # Write the query, with Smin and Smax formatted to 5 decimal places
+        query = np.concatenate([qvec, [k, Smin, Smax, O_value]]).reshape(1, -1)
+        f_queries.write(format_csv(query, ["%.6f"] * D + ["%d", "%.5f", "%.5f", "%d"]))
 
-        # Write the query
-        query_line = ",".join(map(str, qvec)) + f",{k},{Smin_formatted},{Smax_formatted},{O_value}\n"
-        f_queries.write(query_line)
+    store_cache_key([data_file, queries_file], key)
 
     print(f"Data generation complete. {N} data points written to {data_file}.")
-    print(f"Single query written to {queries_file} with [Smin, Smax] = [{Smin_formatted}, {Smax_formatted}].")
+    print(f"Single query written to {queries_file} with [Smin, Smax] = [{Smin:.5f}, {Smax:.5f}].")
 
-if __name__ == "__main__":
-    # Default parameters
-    N = 10000          # Number of data points
-    D = 4              # Dimension of vectors
-    a = 50.0           # Mean of the normal distribution for s
-    b = 25.0           # Variance of the normal distribution for s
-    p = 0.01            # Desired proportion of items satisfying the query condition
-    k_range = (10, 10)  # Range for k values in the query
-    O_value = 1000     # Fixed O value for the query
+# Parameters used when the script is run directly
+DEFAULT_PARAMS = dict(
+    N=10000,          # Number of data points
+    D=4,              # Dimension of vectors
+    s_mean=50.0,      # Mean of the normal distribution for s
+    s_variance=25.0,  # Variance of the normal distribution for s
+    p=0.01,           # Desired proportion of items satisfying the query condition
+    k_range=(10, 10), # Range for k values in the query
+    O_value=1000,     # Fixed O value for the query
+)
 
+if __name__ == "__main__":
     # Generate data and a single query
-    generate_data(N=N, D=D, s_mean=a, s_variance=b, p=p, k_range=k_range, O_value=O_value)
+    generate_data(**DEFAULT_PARAMS)